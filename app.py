@@ -3,11 +3,17 @@ import os
 import sys
 import re
 import time
+import signal
+import socket
+import asyncio
 import logging
 import subprocess
 import threading
 from datetime import datetime
-from flask import Flask, jsonify
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
+from flask import Flask, Response, request
+from waitress import serve
 
 # Setup logging
 logging.basicConfig(
@@ -21,16 +27,96 @@ app = Flask(__name__)
 BASE_DIR = os.getcwd()
 BOTS_DIR = os.path.join(BASE_DIR, "bots")
 
+# Bot type detection - one case-insensitive scan per type
+TELEGRAM_RE = re.compile(rb'telebot|telegram|bot\.polling', re.I)
+TCP_RE = re.compile(rb'socket\.|\.connect\(|\.bind\(', re.I)
+
+# Log banner separator
+_SEP = b'=' * 60 + b'\n'
+
+# A bare "name[extras] <version spec> ; marker" line, safe to share a pip run
+PLAIN_REQUIREMENT_RE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]*(\[[A-Za-z0-9._,\s-]*\])?\s*([<>=!~][^@/\\;]*)?(;[^@]*)?$')
+
+def _is_plain_requirement(line):
+    """True for blank/comment lines and plain specifiers (no options, paths or URLs)"""
+    line = re.sub(r'(^|\s)#.*$', '', line).strip()
+    return not line or (' --' not in line and PLAIN_REQUIREMENT_RE.match(line) is not None)
+
+def _pidfd_supported():
+    """True if os.pidfd_open exists and the kernel supports it"""
+    if not hasattr(os, "pidfd_open"):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return False  # Kernel < 5.3
+    return True
+
 class SimpleBotRunner:
     def __init__(self):
         self.processes = {}
+        self.lock = threading.Lock()
         self.bots = []
+        self.bots_by_id = {}
+        
+        # Cached /api/status payload and counts, rebuilt only after a state change
+        self._status_cache = []
+        self._status_running = []
+        self._status_telegram_count = 0
+        self._status_dirty = True
+        
         self.logs_dir = os.path.join(BASE_DIR, "logs")
         os.makedirs(self.logs_dir, exist_ok=True)
         
+        # requirements.txt files not installed yet; plain ones share one pip
+        # run, see _collect_requirements. _deps_lock serializes pip runs,
+        # _reqs_lock only guards the lists so a rescan never waits on pip
+        self._deps_lock = threading.Lock()
+        self._reqs_lock = threading.Lock()
+        self._shared_requirements = []
+        self._separate_requirements = []
+        
+        # Slow operations (pip, start-all) run here, off the request threads
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        
+        # One event loop thread tracks every bot process (no thread per bot)
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        
+        # Exits are seen through pidfds on the loop's selector (Linux >= 5.3),
+        # else through SIGCHLD
+        self._use_pidfd = _pidfd_supported()
+        if not self._use_pidfd:
+            self._install_sigchld()
+        
         # Scan for bots
         self.scan_bots()
     
+    def _install_sigchld(self):
+        """Wake the event loop on SIGCHLD through a signal wakeup fd"""
+        # The C-level handler writes to the fd from whichever thread gets
+        # the signal; a Python handler alone would wait for the main thread
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        wsock.setblocking(False)
+        try:
+            signal.set_wakeup_fd(wsock.fileno())
+            signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+        except ValueError:
+            # Off the main thread - nothing would ever report an exit
+            logger.warning("⚠️  Not in main thread, polling for bot exits every second instead")
+            rsock.close()
+            wsock.close()
+            self.loop.call_soon_threadsafe(self._poll_periodically)
+            return
+        
+        self._sigchld_socks = (rsock, wsock)
+        self.loop.call_soon_threadsafe(self.loop.add_reader, rsock.fileno(), self._on_sigchld, rsock)
+    
+    def _run(self, coro, timeout=None):
+        """Run a coroutine on the runner's event loop and wait for the result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout=timeout)
+    
     def scan_bots(self):
         """Scan for app.py files in bots directory"""
         logger.info("🔍 Scanning for app.py files...")
@@ -51,39 +137,102 @@ class SimpleBotRunner:
                 
                 logger.info(f"📝 Created: bots/bot{i}/app.py")
             
+            self._publish_bots([])
             return
         
         # Scan all subdirectories
-        for item in os.listdir(BOTS_DIR):
-            bot_path = os.path.join(BOTS_DIR, item)
-            
-            if os.path.isdir(bot_path):
-                app_file = os.path.join(bot_path, "app.py")
+        found = []
+        with os.scandir(BOTS_DIR) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
                 
-                if os.path.exists(app_file):
-                    bot_info = self.create_bot_info(bot_path, app_file)
-                    if bot_info:
-                        self.bots.append(bot_info)
-                        logger.info(f"✅ Found: {bot_info['name']}")
+                # One pass over the folder picks up app.py and requirements.txt
+                app_entry = None
+                has_requirements = False
+                with os.scandir(entry.path) as files:
+                    for f in files:
+                        if f.name == "app.py":
+                            app_entry = f
+                        elif f.name == "requirements.txt":
+                            has_requirements = True
+                
+                if app_entry is not None:
+                    found.append((entry.path, app_entry, has_requirements))
                 else:
-                    logger.info(f"📁 {item}: No app.py (ignoring)")
+                    logger.info(f"📁 {entry.name}: No app.py (ignoring)")
+        
+        # Read the app.py files in parallel (I/O bound, reads release the GIL)
+        bots = []
+        if found:
+            with ThreadPoolExecutor(max_workers=min(16, len(found))) as executor:
+                futures = [executor.submit(self.create_bot_info, *args) for args in found]
+                for future in as_completed(futures):
+                    bot_info = future.result()
+                    if bot_info:
+                        bots.append(bot_info)
+        
+        # Keep a stable order regardless of completion order
+        bots.sort(key=lambda bot: bot["display_name"])
+        for bot_info in bots:
+            logger.info(f"✅ Found: {bot_info['name']}")
+        
+        self._publish_bots(bots)
         
         logger.info(f"📊 Total app.py files found: {len(self.bots)}")
+        
+        self._collect_requirements()
     
-    def create_bot_info(self, bot_path, app_file):
+    def _publish_bots(self, bots):
+        """Swap in a finished scan so status polls never see a partial list"""
+        bots_by_id = {bot["id"]: bot for bot in bots}
+        
+        with self.lock:
+            self.bots = bots
+            self.bots_by_id = bots_by_id
+            self._status_dirty = True
+    
+    def _collect_requirements(self):
+        """Split bots' requirements.txt into shared and separate pip runs"""
+        shared = []
+        separate = []
+        
+        for bot in self.bots:
+            if not bot["has_requirements"]:
+                continue
+            req_file = os.path.join(bot["folder"], "requirements.txt")
+            try:
+                with open(req_file, 'r', encoding='utf-8', errors='ignore') as f:
+                    plain = all(_is_plain_requirement(line) for line in f)
+            except OSError as e:
+                logger.error(f"❌ Error reading {req_file}: {e}")
+                continue
+            
+            # Options, paths and URLs resolve against the file's own folder
+            (shared if plain else separate).append(req_file)
+        
+        # New scan, new requirements - install again on next start
+        with self._reqs_lock:
+            self._shared_requirements = shared
+            self._separate_requirements = separate
+        
+        logger.info(f"📦 Requirements: {len(shared)} shared, {len(separate)} separate")
+    
+    def create_bot_info(self, bot_path, app_entry, has_requirements):
         """Create bot information dictionary"""
+        app_file = app_entry.path
         try:
-            with open(app_file, 'r', encoding='utf-8', errors='ignore') as f:
+            # Raw bytes - no need to decode just to count lines
+            with open(app_file, 'rb') as f:
                 content = f.read()
             
-            file_size = os.path.getsize(app_file)
-            lines = content.count('\n') + 1
+            file_size = app_entry.stat().st_size
+            lines = content.count(b'\n') + 1
             
             # Simple type detection
-            content_lower = content.lower()
-            if any(x in content_lower for x in ['telebot', 'telegram', 'bot.polling']):
+            if TELEGRAM_RE.search(content):
                 bot_type = "telegram"
-            elif any(x in content_lower for x in ['socket.', '.connect(', '.bind(']):
+            elif TCP_RE.search(content):
                 bot_type = "tcp"
             else:
                 bot_type = "generic"
@@ -103,8 +252,8 @@ class SimpleBotRunner:
                 "log_file": os.path.join(self.logs_dir, f"{folder_name}.log"),
                 "file_size": file_size,
                 "lines": lines,
-                "has_requirements": os.path.exists(os.path.join(bot_path, "requirements.txt")),
-                "start_time": None,
+                "has_requirements": has_requirements,
+                "start_monotonic": None,
                 "exit_code": None
             }
             
@@ -112,139 +261,234 @@ class SimpleBotRunner:
             logger.error(f"❌ Error reading {app_file}: {e}")
             return None
     
-    def install_dependencies(self, bot_info):
-        """Install requirements.txt if exists"""
-        req_file = os.path.join(bot_info["folder"], "requirements.txt")
+    def install_dependencies(self):
+        """Install requirements files that haven't installed yet; failures retry next time"""
+        with self._deps_lock:
+            with self._reqs_lock:
+                shared = list(self._shared_requirements)
+                separate = list(self._separate_requirements)
+            installed = set()
+            
+            if len(shared) > 1:
+                logger.info(f"📦 Installing dependencies for {len(shared)} bot(s) in one pip run...")
+                args = []
+                for req_file in shared:
+                    args += ["-r", req_file]
+                if self._pip_install(args):
+                    installed.update(shared)
+                    shared = []
+                else:
+                    # e.g. two bots pin conflicting versions - install each on its own
+                    logger.warning("⚠️  Combined install failed, installing per bot")
+            
+            for req_file in shared + separate:
+                logger.info(f"📦 Installing dependencies from {req_file}...")
+                if self._pip_install(["-r", req_file], cwd=os.path.dirname(req_file)):
+                    installed.add(req_file)
+            
+            # Only the files that failed are tried again
+            with self._reqs_lock:
+                self._shared_requirements = [f for f in self._shared_requirements if f not in installed]
+                self._separate_requirements = [f for f in self._separate_requirements if f not in installed]
+    
+    def _pip_install(self, args, cwd=None, timeout=120):
+        """Run pip install, logging pip's stderr on failure; True on success"""
+        cmd = [sys.executable, "-m", "pip", "install", *args,
+               "--quiet", "--disable-pip-version-check", "--no-input"]
+        try:
+            result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            logger.error(f"❌ pip install {' '.join(args)} timed out after {timeout}s")
+            return False
+        except OSError as e:
+            logger.error(f"❌ pip install {' '.join(args)} failed: {e}")
+            return False
         
-        if os.path.exists(req_file):
-            logger.info(f"📦 Installing dependencies for {bot_info['name']}...")
-            try:
-                subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "-r", req_file, "--quiet"],
-                    check=False,
-                    capture_output=True,
-                    timeout=30
-                )
-            except:
-                pass
+        if result.returncode != 0:
+            logger.error(f"❌ pip install {' '.join(args)} exited with {result.returncode}:\n{result.stderr.strip()}")
+            return False
+        return True
     
-    def start_bot(self, bot_info):
+    def start_bot(self, bot_info, install_deps=True):
         """Start a single bot - NO AUTO RESTART"""
         bot_name = bot_info["name"]
         
         logger.info(f"🚀 Starting {bot_name}...")
         
-        # Check if already running
+        # Fast path only - _spawn re-checks under the lock
         if bot_info["id"] in self.processes:
-            process_info = self.processes[bot_info["id"]]
-            if process_info["process"].poll() is None:
-                logger.info(f"⚠️  {bot_name} is already running (PID: {process_info['pid']})")
-                return True
+            logger.info(f"⚠️  {bot_name} is already running (PID: {bot_info['pid']})")
+            return True
         
-        # Install dependencies
-        self.install_dependencies(bot_info)
+        # Install dependencies (no-op once every file has installed)
+        if install_deps:
+            self.install_dependencies()
         
         try:
-            # Open log file
-            log_fd = open(bot_info["log_file"], 'a', buffering=1)
-            log_fd.write(f"\n{'='*60}\n")
-            log_fd.write(f"Bot started at {datetime.now()}\n")
-            log_fd.write(f"Command: cd {bot_info['folder']} && python app.py\n")
-            log_fd.write(f"{'='*60}\n")
+            # Start the bot - DIRECT execution, on the event loop
+            pid = self._run(self._spawn(bot_info), timeout=10)
+        except Exception as e:
+            logger.error(f"❌ Failed to start {bot_name}: {e}")
+            return False
+        
+        if pid is None:
+            logger.info(f"⚠️  {bot_name} is already running (PID: {bot_info['pid']})")
+        else:
+            logger.info(f"✅ {bot_name} started! PID: {pid}")
+        
+        return True
+    
+    async def _spawn(self, bot_info):
+        """Spawn a bot process and start watching it for exit; None if already running"""
+        # Starts run one at a time on the loop thread and only _spawn adds to
+        # processes, so nothing can slip in between this check and the insert
+        with self.lock:
+            if bot_info["id"] in self.processes:
+                return None
+        
+        # Open log file
+        log_fd = open(bot_info["log_file"], 'ab', buffering=64*1024)
+        try:
+            # Keep this fd out of other bots; the child gets its own dup as stdout/stderr
+            os.set_inheritable(log_fd.fileno(), False)
+            banner = (
+                b"\n" + _SEP
+                + f"Bot started at {datetime.now()}\n"
+                  f"Command: cd {bot_info['folder']} && python app.py\n".encode()
+                + _SEP
+            )
+            log_fd.write(banner)
+            # Banner must hit the file before the child starts writing
+            log_fd.flush()
             
-            # Start the bot - DIRECT execution
+            # Output goes straight to the log fd - never subprocess.PIPE, which
+            # would pull every byte through Python; /api/logs serves the file
             process = subprocess.Popen(
                 [sys.executable, "app.py"],
                 cwd=bot_info["folder"],
                 stdout=log_fd,
                 stderr=log_fd,
-                text=True,
-                bufsize=1
+                start_new_session=True  # Own process group, see _kill_group
             )
-            
-            # Update bot info
-            bot_info["pid"] = process.pid
-            bot_info["status"] = "running"
-            bot_info["start_time"] = datetime.now()
-            bot_info["log_fd"] = log_fd
-            bot_info["exit_code"] = None
-            
-            # Store process info
+        except:
+            log_fd.close()
+            raise
+        
+        # Update bot info
+        bot_info["pid"] = process.pid
+        bot_info["status"] = "running"
+        bot_info["start_monotonic"] = time.monotonic()
+        bot_info["exit_code"] = None
+        
+        # Store process info
+        with self.lock:
             self.processes[bot_info["id"]] = {
                 "process": process,
                 "bot_info": bot_info,
-                "log_fd": log_fd
+                "log_fd": log_fd,
+                "exited": self.loop.create_future()
             }
-            
-            logger.info(f"✅ {bot_name} started! PID: {process.pid}")
-            
-            # Monitor for exit (but NO auto-restart)
-            threading.Thread(
-                target=self._monitor_bot_exit,
-                args=(bot_info["id"], process),
-                daemon=True
-            ).start()
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to start {bot_name}: {e}")
-            return False
+            self._status_dirty = True
+        
+        self._watch(bot_info["id"], process)
+        
+        return process.pid
     
-    def _monitor_bot_exit(self, bot_id, process):
-        """Monitor bot exit - NO AUTO RESTART"""
-        # Wait for process to finish
-        exit_code = process.wait()
+    def _watch(self, bot_id, process):
+        """Watch for bot exit - NO AUTO RESTART"""
+        if not self._use_pidfd:
+            # Covers an exit that happened before the bot was registered
+            self._poll_children()
+            return
         
-        # Update status
-        if bot_id in self.processes:
-            bot_info = self.processes[bot_id]["bot_info"]
-            bot_info["status"] = "stopped"
-            bot_info["exit_code"] = exit_code
-            
-            # Close log file
-            if self.processes[bot_id].get("log_fd"):
-                self.processes[bot_id]["log_fd"].close()
-            
-            logger.info(f"📊 {bot_info['name']} stopped with exit code: {exit_code}")
-            
-            # Remove from processes dict
-            del self.processes[bot_id]
+        pidfd = os.pidfd_open(process.pid)
+        self.loop.add_reader(pidfd, self._on_pidfd, pidfd, bot_id, process)
     
-    def stop_bot(self, bot_id):
-        """Stop a running bot"""
-        if bot_id in self.processes:
-            process_info = self.processes[bot_id]
-            bot_info = process_info["bot_info"]
-            
-            logger.info(f"🛑 Stopping {bot_info['name']} (PID: {bot_info['pid']})...")
-            
-            # Terminate process
-            process_info["process"].terminate()
-            
-            try:
-                # Wait for graceful shutdown
-                process_info["process"].wait(timeout=5)
-                logger.info(f"✅ {bot_info['name']} stopped gracefully")
-            except:
-                # Force kill if not responding
-                process_info["process"].kill()
-                logger.warning(f"⚠️  {bot_info['name']} force killed")
+    def _on_pidfd(self, pidfd, bot_id, process):
+        """pidfd became readable: the bot has exited"""
+        self.loop.remove_reader(pidfd)
+        os.close(pidfd)
+        process.wait()  # Already exited, just reaps it
+        self._on_exit(bot_id, process)
+    
+    def _on_sigchld(self, rsock):
+        """Drain the wakeup socket and check which bots exited"""
+        try:
+            while rsock.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._poll_children()
+    
+    def _poll_children(self):
+        """Fallback for kernels without pidfd: check every bot for an exit"""
+        for bot_id, process_info in list(self.processes.items()):
+            if process_info["process"].poll() is not None:
+                self._on_exit(bot_id, process_info["process"])
+    
+    def _poll_periodically(self, interval=1.0):
+        """Last resort without pidfd or SIGCHLD: check bots on a timer"""
+        self._poll_children()
+        self.loop.call_later(interval, self._poll_periodically, interval)
+    
+    def _on_exit(self, bot_id, process):
+        """Record a bot's exit, close its log file and drop it from processes"""
+        with self.lock:
+            process_info = self.processes.get(bot_id)
+            if process_info is None or process_info["process"] is not process:
+                return  # Already handled
+            del self.processes[bot_id]
             
             # Close log file
             if process_info.get("log_fd"):
                 process_info["log_fd"].close()
             
-            # Update bot info
+            # Update status
+            bot_info = process_info["bot_info"]
             bot_info["status"] = "stopped"
-            bot_info["exit_code"] = process_info["process"].returncode
-            
-            # Remove from processes
-            del self.processes[bot_id]
-            
-            return True
+            bot_info["exit_code"] = process.returncode
+            self._status_dirty = True
         
-        return False
+        process_info["exited"].set_result(process.returncode)
+        logger.info(f"📊 {bot_info['name']} stopped with exit code: {process.returncode}")
+    
+    def _kill_group(self, process, sig):
+        """Signal the bot's whole process group (bot + its children)"""
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass
+    
+    def stop_bot(self, bot_id):
+        """Stop a running bot"""
+        return self._run(self._stop(bot_id), timeout=15)
+    
+    async def _stop(self, bot_id):
+        """SIGTERM a bot's group, SIGKILL it after 5s"""
+        process_info = self.processes.get(bot_id)
+        if process_info is None:
+            return False
+        
+        bot_info = process_info["bot_info"]
+        process = process_info["process"]
+        
+        logger.info(f"🛑 Stopping {bot_info['name']} (PID: {bot_info['pid']})...")
+        
+        # Terminate process group
+        self._kill_group(process, signal.SIGTERM)
+        
+        exited = process_info["exited"]
+        try:
+            # Wait for graceful shutdown
+            await asyncio.wait_for(asyncio.shield(exited), timeout=5)
+            logger.info(f"✅ {bot_info['name']} stopped gracefully")
+        except asyncio.TimeoutError:
+            # Force kill if not responding
+            self._kill_group(process, signal.SIGKILL)
+            await exited
+            logger.warning(f"⚠️  {bot_info['name']} force killed")
+        
+        return True
     
     def start_all_bots(self):
         """Start all bots"""
@@ -252,12 +496,12 @@ class SimpleBotRunner:
         logger.info("🚀 STARTING ALL BOTS (NO AUTO-RESTART)")
         logger.info("="*60)
         
-        success_count = 0
+        # One install attempt for the whole batch, not one per bot
+        self.install_dependencies()
         
-        for bot in self.bots:
-            if self.start_bot(bot):
-                success_count += 1
-            time.sleep(1)  # Small delay
+        # Start in parallel, capped to keep fork pressure reasonable
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            success_count = sum(executor.map(lambda bot: self.start_bot(bot, install_deps=False), self.bots))
         
         logger.info(f"✅ Started {success_count}/{len(self.bots)} bots")
         logger.info("⚠️  Note: Bots will NOT auto-restart on crash")
@@ -266,15 +510,70 @@ class SimpleBotRunner:
         """Stop all running bots"""
         logger.info("🛑 Stopping all bots...")
         
-        for bot_id in list(self.processes.keys()):
-            self.stop_bot(bot_id)
+        count = self._run(self._stop_all(), timeout=30)
+        
+        logger.info(f"✅ All bots stopped ({count})")
+    
+    async def _stop_all(self):
+        """Stop every running bot with one shared grace period"""
+        stopping = list(self.processes.items())
+        if not stopping:
+            return 0
+        
+        # SIGTERM every group at once, then one shared 5s grace period
+        waits = {}
+        for bot_id, process_info in stopping:
+            self._kill_group(process_info["process"], signal.SIGTERM)
+            waits[process_info["exited"]] = process_info
+        
+        _, pending = await asyncio.wait(waits, timeout=5)
+        
+        # Force kill stragglers
+        for fut in pending:
+            process_info = waits[fut]
+            self._kill_group(process_info["process"], signal.SIGKILL)
+            logger.warning(f"⚠️  {process_info['bot_info']['name']} force killed")
+        if pending:
+            await asyncio.wait(pending)
         
-        logger.info("✅ All bots stopped")
+        return len(stopping)
     
     def get_status(self):
         """Get current status of all bots"""
+        return self.get_status_summary()["bots"]
+    
+    def get_status_summary(self):
+        """Status list plus counts, all from the same cached snapshot"""
+        with self.lock:
+            if self._status_dirty:
+                self._rebuild_status()
+            
+            # Only uptime changes between state changes
+            now = time.monotonic()
+            for bot, bot_status in self._status_running:
+                # A rescan in the same second reuses the id with a fresh,
+                # never-started dict - no start time to measure from
+                if bot.get("start_monotonic") is None:
+                    continue
+                uptime_s = int(now - bot["start_monotonic"])
+                hours, rem = divmod(uptime_s, 3600)
+                mins, secs = divmod(rem, 60)
+                bot_status["uptime"] = f"{hours}h {mins}m {secs}s"
+            
+            running = len(self._status_running)
+            return {
+                "bots": self._status_cache,
+                "total": len(self._status_cache),
+                "running": running,
+                "stopped": len(self._status_cache) - running,
+                "telegram_count": self._status_telegram_count
+            }
+    
+    def _rebuild_status(self):
+        """Rebuild the cached status list from bots and live processes"""
         status_list = []
-        current_time = datetime.now()
+        running_list = []
+        telegram_count = 0
         
         for bot in self.bots:
             bot_status = {
@@ -291,35 +590,32 @@ class SimpleBotRunner:
                 "has_requirements": bot["has_requirements"]
             }
             
-            # Check if running
+            if bot["type"] == "telegram":
+                telegram_count += 1
+            
+            # Check if running (exited bots are dropped by _on_exit)
             if bot["id"] in self.processes:
-                process = self.processes[bot["id"]]["process"]
-                if process.poll() is None:  # Still running
-                    bot_status["running"] = True
-                    
-                    # Calculate uptime
-                    if bot.get("start_time"):
-                        uptime = current_time - bot["start_time"]
-                        hours, rem = divmod(uptime.seconds, 3600)
-                        mins, secs = divmod(rem, 60)
-                        bot_status["uptime"] = f"{hours}h {mins}m {secs}s"
-                else:
-                    # Process finished but not cleaned up yet
-                    bot_status["exit_code"] = process.returncode
+                bot_status["running"] = True
+                running_list.append((bot, bot_status))
+            elif bot.get("exit_code") is not None:
+                bot_status["exit_code"] = bot["exit_code"]
             
             status_list.append(bot_status)
         
-        return status_list
+        self._status_cache = status_list
+        self._status_running = running_list
+        self._status_telegram_count = telegram_count
+        self._status_dirty = False
 
 # Create runner instance
 runner = SimpleBotRunner()
 
-# Flask Routes
-@app.route('/')
-def home():
-    status = runner.get_status()
-    
-    html = '''
+def _json(obj):
+    """JSON response encoded with orjson (C encoder, returns bytes)"""
+    return Response(orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC), mimetype='application/json')
+
+# Dashboard page - encoded once, the JS polls /api/status for data
+_DASHBOARD_HTML = '''
     <!DOCTYPE html>
     <html>
     <head>
@@ -492,60 +788,103 @@ def home():
         </script>
     </body>
     </html>
-    '''
-    
-    return html
+    '''.encode('utf-8')
+
+# Flask Routes
+@app.route('/')
+def home():
+    response = Response(_DASHBOARD_HTML, content_type='text/html; charset=utf-8')
+    response.headers['Cache-Control'] = 'public, max-age=30'
+    return response
 
 @app.route('/api/status')
 def api_status():
-    status = runner.get_status()
+    summary = runner.get_status_summary()
     
-    running = sum(1 for bot in status if bot["running"])
-    stopped = len(status) - running
-    telegram_count = sum(1 for bot in status if bot["type"] == "telegram")
-    
-    return jsonify({
+    return _json({
         "success": True,
-        "bots": status,
-        "total": len(status),
-        "running": running,
-        "stopped": stopped,
-        "telegram_count": telegram_count,
+        "bots": summary["bots"],
+        "total": summary["total"],
+        "running": summary["running"],
+        "stopped": summary["stopped"],
+        "telegram_count": summary["telegram_count"],
         "auto_restart": False
     })
 
 @app.route('/api/start/<bot_id>', methods=['POST'])
 def api_start_bot(bot_id):
-    for bot in runner.bots:
-        if bot["id"] == bot_id:
-            success = runner.start_bot(bot)
-            return jsonify({"success": success, "message": f"Started {bot['name']}"})
-    return jsonify({"success": False, "message": "Bot not found"}), 404
+    bot = runner.bots_by_id.get(bot_id)
+    if bot is None:
+        return _json({"success": False, "message": "Bot not found"}), 404
+    # First start may run pip - don't hold the request thread for it
+    runner.executor.submit(runner.start_bot, bot)
+    return _json({"success": True, "message": f"Starting {bot['name']}"})
+
+@app.route('/api/logs/<bot_id>')
+def api_logs(bot_id):
+    bot = runner.bots_by_id.get(bot_id)
+    if bot is None:
+        return _json({"success": False, "message": "Bot not found"}), 404
+    
+    try:
+        log = open(bot["log_file"], 'rb')
+    except FileNotFoundError:
+        return Response(b'', mimetype='text/plain')
+    
+    size = os.fstat(log.fileno()).st_size
+    offset = min(max(request.args.get('offset', 0, type=int), 0), size)
+    count = min(max(request.args.get('count', size - offset, type=int), 0), size - offset)
+    log.seek(offset)
+    
+    # Hand the open file to the server's wsgi.file_wrapper - waitress reads
+    # it in blocks and stops at Content-Length, so the range is exact.
+    # Without a file_wrapper, stream exactly count bytes ourselves
+    file_wrapper = request.environ.get('wsgi.file_wrapper')
+    if file_wrapper is not None:
+        body = file_wrapper(log, 64 * 1024)
+    else:
+        body = _read_range(log, count)
+    
+    response = Response(body, mimetype='text/plain', direct_passthrough=True)
+    response.content_length = count
+    response.headers['X-Log-Size'] = str(size)
+    return response
+
+def _read_range(f, count, chunk_size=64 * 1024):
+    """Yield count bytes from the current position of f, then close it"""
+    try:
+        while count > 0:
+            data = f.read(min(chunk_size, count))
+            if not data:
+                break
+            count -= len(data)
+            yield data
+    finally:
+        f.close()
 
 @app.route('/api/stop/<bot_id>', methods=['POST'])
 def api_stop_bot(bot_id):
     success = runner.stop_bot(bot_id)
-    return jsonify({"success": success, "message": f"Stopped bot" if success else "Bot not running"})
+    return _json({"success": success, "message": f"Stopped bot" if success else "Bot not running"})
 
 @app.route('/api/start-all', methods=['POST'])
 def api_start_all():
-    runner.start_all_bots()
-    return jsonify({"success": True, "message": "Starting all bots"})
+    runner.executor.submit(runner.start_all_bots)
+    return _json({"success": True, "message": "Starting all bots"})
 
 @app.route('/api/stop-all', methods=['POST'])
 def api_stop_all():
     runner.stop_all_bots()
-    return jsonify({"success": True, "message": "Stopped all bots"})
+    return _json({"success": True, "message": "Stopped all bots"})
 
 @app.route('/api/rescan', methods=['POST'])
 def api_rescan():
-    runner.bots = []
     runner.scan_bots()
-    return jsonify({"success": True, "message": "Rescanned bots", "count": len(runner.bots)})
+    return _json({"success": True, "message": "Rescanned bots", "count": len(runner.bots)})
 
 @app.route('/health')
 def health():
-    return jsonify({
+    return _json({
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "bots": len(runner.bots),
@@ -573,9 +912,16 @@ def main():
     if runner.bots:
         logger.info(f"\n✅ Found {len(runner.bots)} app.py file(s)")
     
+    # SIGTERM (e.g. a redeploy) should shut down like Ctrl+C does
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
     # Start web server
     logger.info(f"\n🌐 Starting web server on port {port}...")
-    app.run(host='0.0.0.0', port=port, debug=False)
+    try:
+        serve(app, host='0.0.0.0', port=port, threads=8, channel_timeout=30)
+    finally:
+        # Bots run in their own sessions, so they don't get our SIGINT/SIGTERM
+        runner.stop_all_bots()
 
 if __name__ == "__main__":
     main()